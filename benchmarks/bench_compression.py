@@ -0,0 +1,163 @@
+"""
+Bytes on the wire and latency cost of response compression for typical dashboards.
+
+Builds /api/dashboard-data bodies for a few dashboard sizes, the per-bank
+/transactions/batch body from the app-to-bank hop, and the dashboard.html
+template, then encodes each with the settings ResponseCompressor uses
+(gzip -6, brotli quality 4). The SSE dashboard stream is measured with a
+flush after every event, as the streaming mode sends it.
+
+Latency is estimated as compress + transfer + decompress at the given
+link speeds; brotli is skipped when it is not installed.
+
+Usage (from the repository root):
+    python benchmarks/bench_compression.py --repeat 20 --links 5,50,1000
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+import zlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stub_banks import make_transactions  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 4
+AADHAAR = '123456789012'
+
+# name -> (banks, accounts per bank, transactions per account)
+DASHBOARDS = {
+    'small (1 bank, 1 acct)': (1, 1, 50),
+    'typical (3 banks, 2 accts)': (3, 2, 50),
+    'large (3 banks, 4 accts)': (3, 4, 200),
+}
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def dashboard_payload(banks, accounts_per_bank, transactions_per_account):
+    accounts = []
+    transactions = {}
+    bank_responses = {}
+    for code in ('SBI', 'HDFC', 'ICICI')[:banks]:
+        bank_accounts = [
+            {
+                'account_number': f"{code}{AADHAAR[-4:]}{i:04d}",
+                'user_name': 'Benchmark User',
+                'account_type': 'savings',
+                'balance': 50000.0,
+                'ifsc_code': f"{code[:4]}0001234"
+            }
+            for i in range(accounts_per_bank)
+        ]
+        for account in bank_accounts:
+            account.update(bank_code=code, bank_name=f"{code} Bank")
+            transactions[account['account_number']] = make_transactions(account['account_number'], transactions_per_account)
+        accounts.extend(bank_accounts)
+        bank_responses[code] = {'status': 'success', 'bank_name': f"{code} Bank", 'account_count': len(bank_accounts)}
+    return {
+        'user': {'username': 'benchmark', 'email': 'bench@example.com', 'aadhar_number': AADHAAR},
+        'banking_data': {
+            'accounts': accounts,
+            'total_balance': sum(account['balance'] for account in accounts),
+            'transactions': transactions,
+            'bank_responses': bank_responses,
+            'server_status': 'success',
+        },
+    }
+
+
+def sse_events(payload):
+    yield f"event: user\ndata: {json.dumps(payload['user'])}\n\n".encode()
+    data = payload['banking_data']
+    for code in data['bank_responses']:
+        accounts = [acc for acc in data['accounts'] if acc['bank_code'] == code]
+        yield f"event: bank\ndata: {json.dumps({'bank_code': code, 'accounts': accounts})}\n\n".encode()
+        for account in accounts:
+            body = {'account_number': account['account_number'], 'transactions': data['transactions'][account['account_number']]}
+            yield f"event: transactions\ndata: {json.dumps(body)}\n\n".encode()
+    yield f"event: totals\ndata: {json.dumps({'total_balance': data['total_balance']})}\n\n".encode()
+
+
+def codecs():
+    yield 'identity', lambda body: body, lambda raw: raw
+    yield 'gzip', lambda body: gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0), gzip.decompress
+    if brotli is not None:
+        yield 'br', lambda body: brotli.compress(body, quality=BROTLI_QUALITY), brotli.decompress
+
+
+def stream_gzip(events):
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+    return sum(len(compressor.compress(event) + compressor.flush(zlib.Z_SYNC_FLUSH)) for event in events) + len(compressor.flush())
+
+
+def stream_brotli(events):
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+    return sum(len(compressor.process(event) + compressor.flush()) for event in events) + len(compressor.finish())
+
+
+def report(name, body, repeat, links):
+    print(f"\n{name}: {len(body)} bytes")
+    header = f"  {'encoding':<10}{'bytes':>10}{'ratio':>8}{'enc ms':>9}{'dec ms':>9}"
+    header += ''.join(f"{f'@{mbps}Mbps ms':>14}" for mbps in links)
+    print(header)
+    for encoding, encode, decode in codecs():
+        encoded = encode(body)
+        assert decode(encoded) == body
+        encode_s = best_of(repeat, lambda: encode(body))
+        decode_s = best_of(repeat, lambda: decode(encoded))
+        line = f"  {encoding:<10}{len(encoded):>10}{len(body) / len(encoded):>8.1f}{encode_s * 1000:>9.2f}{decode_s * 1000:>9.2f}"
+        for mbps in links:
+            total = encode_s + decode_s + len(encoded) * 8 / (mbps * 1_000_000)
+            line += f"{total * 1000:>14.2f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--links', default='5,50,1000', help='comma-separated link speeds in Mbps')
+    args = parser.parse_args()
+    links = [float(mbps) if '.' in mbps else int(mbps) for mbps in args.links.split(',')]
+
+    print(f"gzip level {GZIP_LEVEL}, brotli quality {BROTLI_QUALITY}, best of {args.repeat} runs")
+    for name, shape in DASHBOARDS.items():
+        payload = dashboard_payload(*shape)
+        report(f"/api/dashboard-data {name}", json.dumps(payload, sort_keys=True).encode(), args.repeat, links)
+
+        events = list(sse_events(payload))
+        streamed = f"  SSE stream, flushed per event: identity {sum(map(len, events))}, gzip {stream_gzip(events)}"
+        if brotli is not None:
+            streamed += f", br {stream_brotli(events)}"
+        print(streamed + " bytes")
+
+    typical = dashboard_payload(*DASHBOARDS['typical (3 banks, 2 accts)'])
+    batch = {number: rows for number, rows in typical['banking_data']['transactions'].items() if number.startswith('SBI')}
+    report("bank hop /transactions/batch (one bank, typical)", json.dumps(batch).encode(), args.repeat, links)
+
+    with open(os.path.join(ROOT, 'templates', 'dashboard.html'), 'rb') as template:
+        report("dashboard.html template", template.read(), args.repeat, links)
+
+    if brotli is None:
+        print("\nbrotli not installed: ResponseCompressor serves gzip only")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Concurrent dashboard-load benchmark for BankingService.fetch_all_banking_data.
+
+Runs N simultaneous uncached aggregations against local stub banks and
+reports wall time, peak thread count and peak RSS, so the async fan-out
+engine can be checked for steady resource use under load. With
+--distinct-users below --concurrency, callers share Aadhaars and the
+single-flight layer coalesces their fan-outs; the bank request count and
+coalescing counters show the effect.
+
+Usage (from the repository root, with the app's dependencies installed):
+    python benchmarks/bench_fanout_load.py --concurrency 1000 --latency 0.05
+"""
+import argparse
+import os
+import resource
+import sys
+import threading
+import time
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_banks import start_stub_banks, point_app_at  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=1000)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--accounts', type=int, default=2)
+    parser.add_argument('--transactions', type=int, default=50)
+    parser.add_argument('--latency', type=float, default=0.05)
+    parser.add_argument('--distinct-users', type=int, default=None,
+                        help='number of distinct Aadhaars spread across callers (default: one per caller)')
+    args = parser.parse_args()
+
+    # The mirror, presence index and snapshot store need PostgreSQL; measure the live fan-out only
+    os.environ.setdefault('BANK_MIRROR_ENABLED', 'false')
+    os.environ.setdefault('BANK_PRESENCE_INDEX_ENABLED', 'false')
+    os.environ.setdefault('BANK_SNAPSHOT_ENABLED', 'false')
+    import app as vyom
+
+    stubs = start_stub_banks(
+        list(vyom.BankConfig.SERVERS),
+        accounts_per_user=args.accounts,
+        transactions_per_account=args.transactions,
+        latency=args.latency
+    )
+    point_app_at(stubs, vyom.BankConfig.SERVERS)
+
+    peak_threads = threading.active_count()
+    stop = threading.Event()
+
+    def sample_threads():
+        nonlocal peak_threads
+        while not stop.is_set():
+            peak_threads = max(peak_threads, threading.active_count())
+            time.sleep(0.01)
+
+    sampler = threading.Thread(target=sample_threads, daemon=True)
+    sampler.start()
+
+    distinct_users = args.distinct_users or args.concurrency
+    aadhaars = [f"{100000000000 + (i % distinct_users)}" for i in range(args.concurrency)]
+    print(f"Running {args.rounds} rounds of {args.concurrency} concurrent dashboard loads "
+          f"({len(stubs)} banks, {args.accounts} accounts/bank, {args.latency * 1000:.0f}ms latency)")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as callers:
+        for round_number in range(1, args.rounds + 1):
+            started = time.perf_counter()
+            results = list(callers.map(
+                lambda aadhaar: vyom.banking_service.fetch_all_banking_data(aadhaar, use_cache=False),
+                aadhaars
+            ))
+            elapsed = time.perf_counter() - started
+            failures = sum(1 for r in results if r.get('server_status') != 'success')
+            rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"  round {round_number}: {elapsed:.2f}s, failures={failures}, "
+                  f"peak threads={peak_threads}, peak RSS={rss_mb:.1f} MB")
+
+    stop.set()
+    total_requests = sum(stub.request_count for stub in stubs.values())
+    print(f"Bank requests served: {total_requests}")
+    print(f"Request coalescing: {vyom.banking_service.get_coalescing_stats()}")
+    print(f"Thread count excluding {args.concurrency} caller threads: {peak_threads - args.concurrency}")
+
+
+if __name__ == '__main__':
+    main()
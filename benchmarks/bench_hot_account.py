@@ -0,0 +1,111 @@
+"""
+Concurrent debits and credits against one hot account on a running bank server.
+
+Many threads hit /debit (and, with --credit-every, /credit) for the same
+account. The script reports throughput and latency, then re-reads the
+balance and checks it against the successful operations: the final
+balance must equal start - debits + credits exactly and must never go
+negative, however many debits were attempted.
+
+This needs a real bank server and its MySQL database, and it moves money
+on the account it is pointed at, so use a test account.
+
+Usage (from the repository root, with e.g. the SBI server on :5003):
+    python benchmarks/bench_hot_account.py --url http://localhost:5003 \\
+        --aadhaar 123456789012 --account SBI0001 --threads 64 --ops 50 --amount 10
+"""
+import argparse
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+
+import requests
+
+
+def read_balance(session, url, aadhaar, account):
+    response = session.get(f"{url}/accounts/{aadhaar}", timeout=10)
+    response.raise_for_status()
+    for row in response.json():
+        if row['account_number'] == account:
+            return float(row['balance'])
+    raise SystemExit(f"Account {account} not found for Aadhaar {aadhaar}")
+
+
+def worker(args, start, results, lock, index):
+    session = requests.Session()
+    start.wait()
+    local = []
+    for op in range(args.ops):
+        kind = 'credit' if args.credit_every and (index + op) % args.credit_every == 0 else 'debit'
+        started = time.perf_counter()
+        try:
+            response = session.post(f"{args.url}/{kind}", json={
+                'account_number': args.account,
+                'amount': args.amount,
+                'description': f"hot-account benchmark {kind}"
+            }, timeout=30)
+            body = response.json()
+            outcome = 'ok' if body.get('status') == 'ok' else body.get('error', f"HTTP {response.status_code}")
+        except requests.RequestException as e:
+            outcome = type(e).__name__
+        local.append((kind, outcome, time.perf_counter() - started))
+    with lock:
+        results.extend(local)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://localhost:5003')
+    parser.add_argument('--aadhaar', required=True)
+    parser.add_argument('--account', required=True)
+    parser.add_argument('--threads', type=int, default=64)
+    parser.add_argument('--ops', type=int, default=50, help='operations per thread')
+    parser.add_argument('--amount', type=float, default=10.0)
+    parser.add_argument('--credit-every', type=int, default=0,
+                        help='make every Nth operation a credit (0 = debits only)')
+    args = parser.parse_args()
+
+    session = requests.Session()
+    initial = read_balance(session, args.url, args.aadhaar, args.account)
+    print(f"{args.account}: starting balance {initial:.2f}, "
+          f"{args.threads} threads x {args.ops} ops of {args.amount:.2f}")
+
+    start = threading.Event()
+    lock = threading.Lock()
+    results = []
+    threads = [
+        threading.Thread(target=worker, args=(args, start, results, lock, i))
+        for i in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    started = time.perf_counter()
+    start.set()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    final = read_balance(session, args.url, args.aadhaar, args.account)
+    outcomes = Counter((kind, outcome) for kind, outcome, _ in results)
+    latencies = sorted(latency for _, _, latency in results)
+    debits = outcomes[('debit', 'ok')]
+    credits = outcomes[('credit', 'ok')]
+    expected = initial - debits * args.amount + credits * args.amount
+
+    print(f"{len(results)} requests in {elapsed:.2f}s: {len(results) / elapsed:.0f} req/s")
+    print(f"latency p50 {statistics.median(latencies) * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99) - 1] * 1000:.1f} ms, "
+          f"max {latencies[-1] * 1000:.1f} ms")
+    for (kind, outcome), count in sorted(outcomes.items()):
+        print(f"  {kind:<7}{outcome:<30}{count:>8}")
+    print(f"final balance {final:.2f}, expected {expected:.2f}")
+
+    ok = abs(final - expected) < 0.005 and final >= 0
+    print("balance check: " + ("PASS" if ok else "FAIL"))
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""
+Encode/decode cost of a 10k-transaction payload under each codec.
+
+Compares the stdlib json settings Flask's default provider uses (sorted
+keys) with orjson, as used by FastJSONProvider, and MessagePack, as used
+on the app-to-bank hop with BANK_WIRE_FORMAT=msgpack. Codecs that are
+not installed are skipped.
+
+Usage (from the repository root):
+    python benchmarks/bench_json_codecs.py --transactions 10000 --repeat 20
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_banks import make_transactions  # noqa: E402
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def codecs():
+    yield 'json (Flask default)', lambda obj: json.dumps(obj, sort_keys=True).encode(), json.loads
+    if orjson is not None:
+        yield 'orjson', lambda obj: orjson.dumps(obj, option=orjson.OPT_SORT_KEYS), orjson.loads
+    if msgpack is not None:
+        yield 'msgpack', lambda obj: msgpack.packb(obj, use_bin_type=True), lambda raw: msgpack.unpackb(raw, raw=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--transactions', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    payload = make_transactions('SBI000012345678', args.transactions)
+    print(f"{args.transactions} transactions, best of {args.repeat} runs")
+    print(f"{'codec':<22}{'encode ms':>12}{'decode ms':>12}{'bytes':>12}")
+
+    baseline = None
+    for name, encode, decode in codecs():
+        raw = encode(payload)
+        assert decode(raw) == payload
+        encode_s = best_of(args.repeat, lambda: encode(payload))
+        decode_s = best_of(args.repeat, lambda: decode(raw))
+        baseline = baseline or (encode_s, decode_s)
+        print(f"{name:<22}{encode_s * 1000:>12.2f}{decode_s * 1000:>12.2f}{len(raw):>12}"
+              f"   ({baseline[0] / encode_s:.1f}x / {baseline[1] / decode_s:.1f}x vs json)")
+
+    if orjson is None:
+        print("orjson not installed: FastJSONProvider falls back to the stdlib provider")
+    if msgpack is None:
+        print("msgpack not installed: the bank hop stays on JSON")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Fan-out benchmark with a registry of dozens of banks.
+
+Starts --banks stub bank servers (a few of them slow), registers them all
+through a generated banks.json, and runs concurrent account aggregations
+and Aadhaar lookups. It reports latency percentiles, timed-out banks and
+the number of requests each stub served, so per-bank concurrency caps and
+the overall deadline can be checked for bounded, fair behaviour as the
+registry grows.
+
+Banks where a user holds nothing answer 200 with [], as the real servers
+do. The run fails if any of them is reported as anything but
+no_accounts, since that status is what the presence index records and
+prunes on.
+
+Usage (from the repository root, with the app's dependencies installed):
+    python benchmarks/bench_registry_scale.py --banks 40 --slow-banks 3 --concurrency 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+import concurrent.futures
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stub_banks import StubBank, write_registry  # noqa: E402
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--banks', type=int, default=40)
+    parser.add_argument('--holding-banks', type=int, default=2,
+                        help='banks where each benchmark user holds accounts; the rest return []')
+    parser.add_argument('--slow-banks', type=int, default=2)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--slow-latency', type=float, default=2.0)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--rounds', type=int, default=3)
+    parser.add_argument('--deadline', type=float, default=1.0)
+    parser.add_argument('--max-concurrency', type=int, default=8, help='per-bank in-flight cap written to the registry')
+    args = parser.parse_args()
+
+    stubs = {}
+    for i in range(args.banks):
+        code = f"B{i:03d}"
+        slow = i >= args.banks - args.slow_banks
+        stubs[code] = StubBank(
+            code,
+            accounts_per_user=1 if i < args.holding_banks else 0,
+            transactions_per_account=0,
+            latency=args.slow_latency if slow else args.latency
+        ).start()
+
+    os.environ['BANK_REGISTRY_FILE'] = write_registry(stubs, max_concurrency=args.max_concurrency)
+    # The mirror, presence index and snapshot store need PostgreSQL; measure the live fan-out only
+    os.environ.setdefault('BANK_MIRROR_ENABLED', 'false')
+    os.environ.setdefault('BANK_PRESENCE_INDEX_ENABLED', 'false')
+    os.environ.setdefault('BANK_SNAPSHOT_ENABLED', 'false')
+    import app as vyom
+
+    print(f"{len(vyom.BankConfig.SERVERS)} banks registered ({args.slow_banks} slow at {args.slow_latency * 1000:.0f}ms, "
+          f"others {args.latency * 1000:.0f}ms), per-bank cap {args.max_concurrency}, "
+          f"global cap {vyom.FanoutConfig.MAX_CONCURRENCY}, deadline {args.deadline}s")
+
+    aadhaars = [f"{200000000000 + i}" for i in range(args.concurrency)]
+
+    def timed(fn, aadhaar):
+        started = time.perf_counter()
+        result = fn(aadhaar)
+        return time.perf_counter() - started, result
+
+    def aggregate(aadhaar):
+        return vyom.banking_service.fetch_accounts(aadhaar, use_cache=False, deadline=args.deadline)
+
+    def lookup(aadhaar):
+        return vyom.banking_service.lookup_accounts(aadhaar, deadline=args.deadline)
+
+    misreported = 0
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as callers:
+        for label, fn in (('aggregate', aggregate), ('lookup', lookup)):
+            for round_number in range(1, args.rounds + 1):
+                for stub in stubs.values():
+                    stub.request_count = 0
+                started = time.perf_counter()
+                samples = list(callers.map(lambda aadhaar: timed(fn, aadhaar), aadhaars))
+                elapsed = time.perf_counter() - started
+                latencies = [latency for latency, _ in samples]
+
+                if label == 'aggregate':
+                    timed_out = sum(
+                        1 for _, result in samples
+                        for bank in result.get('bank_responses', {}).values() if bank['status'] == 'timed_out'
+                    )
+                    accounts = statistics.mean(len(result.get('accounts', [])) for _, result in samples)
+                    # An empty bank reported as 'success' would be recorded in the presence index as holding accounts
+                    misreported += sum(
+                        1 for _, result in samples
+                        for bank in result.get('bank_responses', {}).values()
+                        if bank['status'] == 'success' and not bank.get('account_count')
+                    )
+                else:
+                    timed_out = sum(args.banks - len(result) for _, result in samples)
+                    accounts = statistics.mean(sum(len(a) for a in result.values()) for _, result in samples)
+
+                served = [stub.request_count for stub in stubs.values()]
+                print(f"  {label} round {round_number}: {elapsed:.2f}s wall, "
+                      f"p50={percentile(latencies, 50) * 1000:.0f}ms p95={percentile(latencies, 95) * 1000:.0f}ms "
+                      f"max={max(latencies) * 1000:.0f}ms, accounts/user={accounts:.1f}, "
+                      f"timed-out bank answers={timed_out}, "
+                      f"requests/bank min={min(served)} max={max(served)}, threads={threading.active_count()}")
+
+    print("empty-bank check: " + ("PASS" if not misreported else f"FAIL ({misreported} empty banks reported as success)"))
+    sys.exit(1 if misreported else 0)
+
+
+if __name__ == '__main__':
+    main()
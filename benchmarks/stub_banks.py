@@ -0,0 +1,180 @@
+"""
+Lightweight in-process stand-ins for the SBI/HDFC/ICICI bank servers.
+
+They answer the same routes the main app calls (/accounts, /transactions,
+/transactions/batch, /health, /get_accounts_by_aadhaar) with synthetic data and an optional
+artificial latency, so the aggregation code can be benchmarked without
+MySQL or the real bank servers.
+"""
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime, timedelta
+
+
+def make_transactions(account_number, count):
+    now = datetime(2025, 1, 1)
+    return [
+        {
+            'id': i + 1,
+            'account_number': account_number,
+            'type': 'debit' if i % 3 else 'credit',
+            'amount': float(100 + i % 997),
+            'description': f"Synthetic transaction {i + 1}",
+            'balance_after': float(50000 - i),
+            'timestamp': (now + timedelta(minutes=i)).isoformat()
+        }
+        for i in range(count)
+    ][::-1]
+
+
+class StubBank:
+    """One stub bank server on its own port"""
+
+    def __init__(self, bank_code, accounts_per_user=2, transactions_per_account=50, latency=0.0):
+        self.bank_code = bank_code
+        self.accounts_per_user = accounts_per_user
+        self.transactions_per_account = transactions_per_account
+        self.latency = latency
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+
+    def accounts_for(self, aadhaar):
+        return [
+            {
+                'account_number': f"{self.bank_code}{aadhaar[-4:]}{i:04d}",
+                'user_name': 'Benchmark User',
+                'aadhaar_number': aadhaar,
+                'account_type': 'savings',
+                'balance': 50000.0,
+                'phone': '9999999999',
+                'created_at': datetime(2024, 1, 1).isoformat(),
+                'ifsc_code': f"{self.bank_code[:4]}0001234"
+            }
+            for i in range(self.accounts_per_user)
+        ]
+
+    def _handler(self):
+        bank = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _read_json(self):
+                length = int(self.headers.get('Content-Length', 0))
+                return json.loads(self.rfile.read(length) or b'{}')
+
+            def _enter(self):
+                with bank.lock:
+                    bank.request_count += 1
+                if bank.latency:
+                    time.sleep(bank.latency)
+
+            def do_GET(self):
+                self._enter()
+                path, _, query = self.path.partition('?')
+                params = dict(pair.split('=', 1) for pair in query.split('&') if '=' in pair)
+                limit = int(params['limit']) if 'limit' in params else None
+                parts = path.strip('/').split('/')
+                if parts[0] == 'health':
+                    self._send(200, {'status': 'healthy', 'bank': bank.bank_code})
+                elif parts[0] == 'accounts' and len(parts) == 2:
+                    # Like the real bank servers: 200 with [] when the Aadhaar has no accounts here
+                    self._send(200, bank.accounts_for(parts[1]))
+                elif parts[0] == 'transactions' and len(parts) == 2:
+                    self._send(200, make_transactions(parts[1], bank.transactions_per_account)[:limit])
+                else:
+                    self._send(404, {'error': 'Endpoint not found'})
+
+            def do_POST(self):
+                self._enter()
+                data = self._read_json()
+                path = self.path.split('?')[0].strip('/')
+                if path == 'get_accounts_by_aadhaar':
+                    self._send(200, {'accounts': bank.accounts_for(data.get('aadhaar', ''))})
+                elif path == 'transactions/batch' and isinstance(data.get('since'), dict):
+                    # Mirror delta sync: rows after each account's watermark, oldest first
+                    grouped = {
+                        acc: [row for row in make_transactions(acc, bank.transactions_per_account)[::-1]
+                              if row['id'] > int(data['since'].get(acc) or 0)][:data.get('limit')]
+                        for acc in data.get('account_numbers', [])
+                    }
+                    self._send(200, {
+                        'transactions': grouped,
+                        'not_found': [],
+                        'last_ids': {acc: rows[-1]['id'] if rows else int(data['since'].get(acc) or 0)
+                                     for acc, rows in grouped.items()}
+                    })
+                elif path == 'transactions/batch':
+                    self._send(200, {
+                        'transactions': {
+                            acc: make_transactions(acc, bank.transactions_per_account)[:data.get('limit')]
+                            for acc in data.get('account_numbers', [])
+                        },
+                        'not_found': []
+                    })
+                else:
+                    self._send(404, {'error': 'Endpoint not found'})
+
+        return Handler
+
+
+def start_stub_banks(bank_codes, **kwargs):
+    """Start one stub per bank code; returns {bank_code: StubBank}"""
+    return {code: StubBank(code, **kwargs).start() for code in bank_codes}
+
+
+def point_app_at(stubs, servers):
+    """Rewrite a BankConfig.SERVERS-style dict in place to target the stubs"""
+    for code, stub in stubs.items():
+        servers.setdefault(code, {'name': f"{code} Bank"})
+        servers[code]['url'] = stub.url
+        servers[code]['urls'] = [stub.url]
+
+
+def write_registry(stubs, timeout=None, max_concurrency=None):
+    """Write a banks.json-format registry for the stubs and return its path
+
+    Set BANK_REGISTRY_FILE to the returned path before importing app so
+    every stub is registered from the start.
+    """
+    banks = [
+        {
+            'code': code,
+            'name': f"{code} Bank",
+            'urls': [stub.url],
+            'ifsc_prefix': code[:4],
+            'timeout': timeout,
+            'max_concurrency': max_concurrency
+        }
+        for code, stub in stubs.items()
+    ]
+    fd, path = tempfile.mkstemp(prefix='stub-banks-', suffix='.json')
+    with os.fdopen(fd, 'w') as registry_file:
+        json.dump({'banks': banks}, registry_file, indent=2)
+    return path
@@ -0,0 +1,67 @@
+"""
+Worker processes for asynchronous transfers.
+
+/api/transfer and /api/transfer_v2 called with {"async": true} check the
+PIN and debit the source, commit a transfer_outbox entry and answer 202.
+Synchronous transfers whose debit or credit could not be confirmed leave
+an entry too. These processes claim due outbox entries and settle each
+transfer's debit, credit and refund steps through TransferOutboxService;
+credits that stay unconfirmed are parked as RECONCILE, never refunded.
+Claims use FOR UPDATE SKIP LOCKED plus a lease, so any number of
+processes can run against the same database. start-servers.py starts
+this alongside the bank servers; if no worker is running, the web
+process settles entries left unclaimed for a lease and /health reports
+them as stalled.
+
+Usage:
+    python transfer_worker.py --processes 4
+"""
+import argparse
+import multiprocessing
+import os
+import time
+
+
+def run_worker():
+    # This process is the worker, so the web process's fallback thread is not needed here
+    os.environ['TRANSFER_WEB_FALLBACK'] = 'false'
+    # Imported in the child so each process gets its own engine pool and bank clients
+    from app import app, db, logger, transfer_outbox, TransferQueueConfig
+
+    logger.info(f"Transfer worker {os.getpid()} started")
+    with app.app_context():
+        while True:
+            try:
+                claimed = transfer_outbox.run_once()
+            except Exception as e:
+                # The entry's lease expires and another pass picks it up again
+                logger.error(f"Transfer worker error: {str(e)}")
+                db.session.rollback()
+                claimed = 0
+            finally:
+                db.session.remove()
+            if not claimed:
+                time.sleep(TransferQueueConfig.POLL_INTERVAL_SECONDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--processes', type=int, default=int(os.getenv('TRANSFER_WORKER_PROCESSES', 2)))
+    args = parser.parse_args()
+
+    # spawn, not fork: app.py starts background threads at import time
+    context = multiprocessing.get_context('spawn')
+    workers = [context.Process(target=run_worker, name=f"transfer-worker-{i}") for i in range(args.processes)]
+    for worker in workers:
+        worker.start()
+    print(f"Started {len(workers)} transfer worker process(es); Ctrl+C to stop")
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+
+
+if __name__ == '__main__':
+    main()